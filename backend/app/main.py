@@ -1,20 +1,40 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 import os
 import re
-from datetime import datetime
-from io import BytesIO
-import json
-from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import multiprocessing
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+import httpx
+import orjson
+from typing import BinaryIO, Dict, List, Optional
 from enum import Enum
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# --- Severity Classification ---
+from .severity import assign_severity_fallback, needs_ai_review
+
 # --- Document Parsing Libraries ---
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import docx
-import pdfplumber
+from .pdf_extraction import (
+    PDF_BACKEND, pdfplumber, extract_metadata, merge_metadata, metadata_complete,
+    pdf_metadata, tables_on_page, extract_page_tables, extract_pdf_metadata, worker_ready,
+)
+if PDF_BACKEND != "pdfplumber":
+    print(f"✓ Using {PDF_BACKEND} PDF backend")
 
 # --- AI Provider Imports with Error Handling ---
 AI_PROVIDERS = {}
@@ -28,7 +48,7 @@ except ImportError:
 
 # OpenAI
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
     AI_PROVIDERS['openai'] = True
 except ImportError:
     AI_PROVIDERS['openai'] = False
@@ -40,10 +60,30 @@ try:
 except ImportError:
     AI_PROVIDERS['claude'] = False
 
+# --- Optional Accelerators ---
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 app = FastAPI(
     title="A11y Analyzer API",
     description="API for analyzing accessibility conformance reports with multiple AI providers.",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # --- CORS Configuration ---
@@ -56,6 +96,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Response Compression ---
+# Findings JSON is highly repetitive; brotli falls back to gzip for clients without it
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # --- AI Provider Configuration ---
 class AIProvider(str, Enum):
     GEMINI = "gemini"
@@ -63,20 +110,164 @@ class AIProvider(str, Enum):
     CLAUDE = "claude"
     FALLBACK = "fallback"
 
+# (default model, escalation model) per provider. Reviews the default model
+# returns with low confidence are re-asked of the escalation model; escalation
+# is off unless an escalation model is configured.
+AI_MODELS = {
+    "gemini": (os.getenv("GEMINI_MODEL", "gemini-2.5-flash"), os.getenv("GEMINI_ESCALATION_MODEL", "")),
+    "openai": (os.getenv("OPENAI_MODEL", "gpt-4o-mini"), os.getenv("OPENAI_ESCALATION_MODEL", "")),
+    "claude": (os.getenv("ANTHROPIC_MODEL", "claude-haiku-4-5"), os.getenv("ANTHROPIC_ESCALATION_MODEL", "")),
+}
+
+# Provider used when a request doesn't name one, most preferred first
+PROVIDER_PREFERENCE = ("claude", "openai", "gemini")
+
+# Send every finding to AI, including ones the keyword rules are confident about
+AI_REVIEW_ALL = os.getenv("AI_REVIEW_ALL") == "1"
+
+# Maximum AI severity reviews in flight at once per report
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "20"))
+
+# Concurrent reviews for the same provider, across all in-flight reports, are
+# coalesced into one request of up to AI_BATCH_SIZE findings
+AI_BATCH_SIZE = int(os.getenv("AI_BATCH_SIZE", "16"))
+AI_BATCH_LATENCY_MS = int(os.getenv("AI_BATCH_LATENCY_MS", "50"))
+# Output budget per finding; a review is a ~40 token JSON object
+AI_MAX_TOKENS = 120
+AI_MAX_BATCH_TOKENS = 4096
+
+# Static instructions shared by every request, sent as the system prompt so
+# providers can reuse the cached prefix between calls
+SYSTEM_PROMPT = """You are an accessibility expert reviewing WCAG conformance findings.
+Your task is to determine the correct severity level of each finding based on its remarks/explanation.
+Each finding comes with a keyword-based severity guess. A request holds either one finding, or a JSON
+list of findings with ids; for a list, return one result per finding using its id.
+
+Severity Definitions:
+- Critical: Completely blocks users from core tasks (keyboard traps, screen reader complete failure, content totally inaccessible)
+- High: Major barriers significantly impeding use (poor contrast failing 4.5:1, missing alt text on functional images, major navigation issues)
+- Medium: Notable usability issues with workarounds (inconsistent behavior, unclear labels, minor contrast issues)
+- Low: Minor improvements, best practices (cosmetic issues, minor inconsistencies)
+
+Focus on real user impact for people with disabilities."""
+
+# Structured output schemas; providers must reply in exactly these shapes
+SEVERITY_RESULT_PROPERTIES = {
+    "severity": {"type": "string", "enum": ["Critical", "High", "Medium", "Low"]},
+    "reason": {"type": "string", "description": "Brief explanation of why this severity is correct"},
+    "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+}
+
+SEVERITY_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": SEVERITY_RESULT_PROPERTIES,
+    "required": ["severity", "reason", "confidence"],
+}
+
+SEVERITY_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, **SEVERITY_RESULT_PROPERTIES},
+                "required": ["id", "severity", "reason", "confidence"],
+            },
+        },
+    },
+    "required": ["results"],
+}
+
+# Schemas by name, used as the OpenAI schema name and the Claude tool name
+SEVERITY_SCHEMAS = {"record_severity": SEVERITY_RESULT_SCHEMA, "record_severities": SEVERITY_BATCH_SCHEMA}
+
+# Claude always receives every tool so the cached prompt prefix stays identical
+CLAUDE_TOOLS = [
+    {"name": name, "description": "Record the severity review.", "input_schema": schema}
+    for name, schema in SEVERITY_SCHEMAS.items()
+]
+
+def _closed_schema(schema: Dict) -> Dict:
+    """Copy a schema with additional properties disallowed, as OpenAI strict mode requires"""
+    closed = {key: _closed_schema(value) if isinstance(value, dict) else value for key, value in schema.items()}
+    if closed.get("type") == "object":
+        closed["additionalProperties"] = False
+    return closed
+
+# --- AI Request Batching ---
+class AsyncBatcher:
+    """Collect concurrent submissions and hand them to one handler call.
+
+    A batch is dispatched once max_batch_size items are queued or max_latency
+    seconds after its first item arrived. The handler receives the list of
+    items and returns one result (or Exception) per item, in order.
+    """
+
+    def __init__(self, handler, max_batch_size: int = 16, max_latency: float = 0.05):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.pending = []
+        self.timer = None
+        self.tasks = set()
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((item, future))
+        if len(self.pending) >= self.max_batch_size:
+            self._flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, batch):
+        try:
+            results = await self.handler([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
 class AIProviderManager:
     def __init__(self):
         self.providers = {}
+        self.batchers = {}
+        self.http_client = None
         self.configure_providers()
 
     def configure_providers(self):
         """Configure all available AI providers"""
 
+        # OpenAI and Claude share one pooled, keep-alive HTTP client
+        if (AI_PROVIDERS['openai'] and os.getenv("OPENAI_API_KEY")) or (AI_PROVIDERS['claude'] and os.getenv("ANTHROPIC_API_KEY")):
+            self.http_client = self._create_http_client()
+
         # Configure Gemini
         if AI_PROVIDERS['gemini'] and os.getenv("GEMINI_API_KEY"):
             try:
                 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                model, escalation_model = AI_MODELS['gemini']
                 self.providers['gemini'] = {
-                    'client': genai.GenerativeModel('gemini-1.5-flash'),
+                    'client': genai.GenerativeModel(model, system_instruction=SYSTEM_PROMPT),
+                    'escalation_client': genai.GenerativeModel(escalation_model, system_instruction=SYSTEM_PROMPT) if escalation_model else None,
                     'configured': True
                 }
                 print("✓ Gemini API configured successfully")
@@ -88,7 +279,7 @@ class AIProviderManager:
         if AI_PROVIDERS['openai'] and os.getenv("OPENAI_API_KEY"):
             try:
                 self.providers['openai'] = {
-                    'client': OpenAI(api_key=os.getenv("OPENAI_API_KEY")),
+                    'client': AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self.http_client),
                     'configured': True
                 }
                 print("✓ OpenAI API configured successfully")
@@ -100,7 +291,7 @@ class AIProviderManager:
         if AI_PROVIDERS['claude'] and os.getenv("ANTHROPIC_API_KEY"):
             try:
                 self.providers['claude'] = {
-                    'client': anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY")),
+                    'client': anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=self.http_client),
                     'configured': True
                 }
                 print("✓ Claude API configured successfully")
@@ -108,17 +299,32 @@ class AIProviderManager:
                 print(f"✗ Claude configuration failed: {e}")
                 self.providers['claude'] = {'configured': False, 'error': str(e)}
 
-    def get_available_providers(self) -> List[str]:
-        """Get list of configured providers"""
-        return [name for name, config in self.providers.items() if config.get('configured', False)]
+        # Provider setup is fixed after startup, so availability is resolved once here
+        self.available_providers = tuple(name for name, config in self.providers.items() if config.get('configured', False))
+        self.preferred_provider = next((name for name in PROVIDER_PREFERENCE if name in self.available_providers), None)
+
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        """Create the shared provider HTTP client, using HTTP/2 when h2 is installed"""
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        try:
+            return httpx.AsyncClient(http2=True, timeout=60, limits=limits)
+        except ImportError:
+            print("✗ HTTP/2 support not installed, using HTTP/1.1 for AI providers")
+            return httpx.AsyncClient(timeout=60, limits=limits)
+
+    async def aclose(self):
+        """Close the shared provider HTTP client"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    def get_available_providers(self) -> tuple:
+        """Get configured providers, as recorded by configure_providers"""
+        return self.available_providers
 
     def get_preferred_provider(self) -> Optional[str]:
         """Get the first available provider in order of preference"""
-        preference_order = ['claude', 'openai', 'gemini']
-        for provider in preference_order:
-            if provider in self.providers and self.providers[provider].get('configured', False):
-                return provider
-        return None
+        return self.preferred_provider
 
     async def analyze_severity(self, criterion: str, remarks: str, fallback_severity: str, provider: Optional[str] = None) -> Dict:
         """Analyze severity using specified provider or best available"""
@@ -135,247 +341,471 @@ class AIProviderManager:
                 "provider_used": "none"
             }
 
-        prompt = self._build_prompt(criterion, remarks, fallback_severity)
-
-        try:
-            if provider == 'gemini':
-                return await self._analyze_with_gemini(prompt, fallback_severity)
-            elif provider == 'openai':
-                return await self._analyze_with_openai(prompt, fallback_severity)
-            elif provider == 'claude':
-                return await self._analyze_with_claude(prompt, fallback_severity)
-        except Exception as e:
-            print(f"AI analysis failed with {provider}: {e}")
-            # Try fallback to another provider
-            available = [p for p in self.get_available_providers() if p != provider]
-            if available:
-                print(f"Trying fallback provider: {available[0]}")
-                return await self.analyze_severity(criterion, remarks, fallback_severity, available[0])
+        # Try the chosen provider, then each other provider once
+        error = None
+        candidates = [provider] + [p for p in self.get_available_providers() if p != provider]
+        for attempt, candidate in enumerate(candidates):
+            if attempt:
+                print(f"Trying fallback provider: {candidate}")
+            try:
+                return await self._batcher(candidate).submit((criterion, remarks, fallback_severity))
+            except Exception as e:
+                error = e
+                print(f"AI analysis failed with {candidate}: {e}")
 
         return {
             "severity": fallback_severity,
             "ai_corrected": False,
-            "correction_reason": f"AI analysis failed: {str(e)[:100]}",
+            "correction_reason": f"AI analysis failed: {str(error)[:100]}",
             "confidence": "fallback",
             "provider_used": "none"
         }
 
-    def _build_prompt(self, criterion: str, remarks: str, fallback_severity: str) -> str:
-        """Build standardized prompt for all AI providers"""
-        return f"""You are an accessibility expert reviewing WCAG conformance findings.
-Your task is to determine the correct severity level based on the remarks/explanation.
+    def _batcher(self, provider: str) -> AsyncBatcher:
+        """Get the request batcher for a provider"""
+        if provider not in self.batchers:
+            self.batchers[provider] = AsyncBatcher(
+                partial(self._analyze_batch, provider),
+                max_batch_size=AI_BATCH_SIZE,
+                max_latency=AI_BATCH_LATENCY_MS / 1000
+            )
+        return self.batchers[provider]
+
+    async def _analyze_batch(self, provider: str, items: List[tuple]) -> List:
+        """Review a batch of (criterion, remarks, fallback_severity) items, escalating low-confidence results"""
+        results = await self._review(provider, items)
+
+        escalate = [index for index, result in enumerate(results)
+                    if isinstance(result, dict) and result["confidence"] == "low"]
+        if escalate and AI_MODELS[provider][1] and AI_MODELS[provider][1] != AI_MODELS[provider][0]:
+            try:
+                escalated = await self._review(provider, [items[index] for index in escalate], escalate=True)
+                for index, result in zip(escalate, escalated):
+                    if isinstance(result, dict):
+                        results[index] = result
+            except Exception as e:
+                print(f"AI escalation failed with {provider}, keeping first answers: {e}")
+
+        for result in results:
+            if isinstance(result, dict):
+                result['provider_used'] = provider
+        return results
+
+    async def _review(self, provider: str, items: List[tuple], escalate: bool = False) -> List:
+        """Send one review request for the items and parse a result per item"""
+        if len(items) == 1:
+            reply = await self._complete(provider, self._build_prompt(*items[0]),
+                                         "record_severity", AI_MAX_TOKENS, escalate)
+            return [self._parse_ai_response(reply, items[0][2])]
+
+        reply = await self._complete(provider, self._build_batch_prompt(items),
+                                     "record_severities",
+                                     min(AI_MAX_TOKENS * len(items), AI_MAX_BATCH_TOKENS), escalate)
+        return self._parse_batch_response(reply, items)
+
+    async def _complete(self, provider: str, prompt: str, schema_name: str, max_tokens: int, escalate: bool = False) -> Dict:
+        """Send a prompt to the given provider and return its reply, structured by the named schema"""
+        if provider == 'gemini':
+            return await self._complete_with_gemini(prompt, schema_name, max_tokens, escalate)
+        elif provider == 'openai':
+            return await self._complete_with_openai(prompt, schema_name, max_tokens, escalate)
+        elif provider == 'claude':
+            return await self._complete_with_claude(prompt, schema_name, max_tokens, escalate)
+        raise ValueError(f"Unknown AI provider: {provider}")
 
-WCAG Criterion: {criterion}
+    def _build_prompt(self, criterion: str, remarks: str, fallback_severity: str) -> str:
+        """Build the per-finding user prompt; instructions live in SYSTEM_PROMPT"""
+        return f"""WCAG Criterion: {criterion}
 Remarks/Explanation: "{remarks}"
-Current Severity (keyword-based): {fallback_severity}
-
-Severity Definitions:
-- Critical: Completely blocks users from core tasks (keyboard traps, screen reader complete failure, content totally inaccessible)
-- High: Major barriers significantly impeding use (poor contrast failing 4.5:1, missing alt text on functional images, major navigation issues)
-- Medium: Notable usability issues with workarounds (inconsistent behavior, unclear labels, minor contrast issues)
-- Low: Minor improvements, best practices (cosmetic issues, minor inconsistencies)
-
-Respond with ONLY a valid JSON object with these fields:
-{{
-    "severity": "Critical|High|Medium|Low",
-    "reason": "Brief explanation of why this severity is correct",
-    "confidence": "high|medium|low"
-}}
-
-Focus on real user impact for people with disabilities."""
-
-    async def _analyze_with_gemini(self, prompt: str, fallback_severity: str) -> Dict:
-        """Analyze using Gemini"""
-        client = self.providers['gemini']['client']
-        response = client.generate_content(prompt)
-        result = self._parse_ai_response(response.text, fallback_severity)
-        result['provider_used'] = 'gemini'
-        return result
+Current Severity (keyword-based): {fallback_severity}"""
+
+    def _build_batch_prompt(self, items: List[tuple]) -> str:
+        """Build one user prompt covering several findings, each tagged with an id"""
+        findings = orjson.dumps([
+            {"id": index, "criterion": criterion, "remarks": remarks, "current_severity": fallback_severity}
+            for index, (criterion, remarks, fallback_severity) in enumerate(items)
+        ]).decode()
+        return f"Findings:\n{findings}"
+
+    async def _complete_with_gemini(self, prompt: str, schema_name: str, max_tokens: int, escalate: bool = False) -> Dict:
+        """Complete using Gemini JSON mode"""
+        client = self.providers['gemini']['escalation_client' if escalate else 'client']
+        response = await client.generate_content_async(
+            prompt,
+            generation_config={
+                "max_output_tokens": max_tokens,
+                "response_mime_type": "application/json",
+                "response_schema": SEVERITY_SCHEMAS[schema_name]
+            }
+        )
+        return orjson.loads(response.text)
 
-    async def _analyze_with_openai(self, prompt: str, fallback_severity: str) -> Dict:
-        """Analyze using OpenAI"""
+    async def _complete_with_openai(self, prompt: str, schema_name: str, max_tokens: int, escalate: bool = False) -> Dict:
+        """Complete using OpenAI structured outputs"""
         client = self.providers['openai']['client']
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=300,
-            temperature=0.1
+        response = await client.chat.completions.create(
+            model=AI_MODELS['openai'][1 if escalate else 0],
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.1,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": schema_name, "strict": True, "schema": _closed_schema(SEVERITY_SCHEMAS[schema_name])}
+            }
         )
-        result = self._parse_ai_response(response.choices[0].message.content, fallback_severity)
-        result['provider_used'] = 'openai'
-        return result
+        return orjson.loads(response.choices[0].message.content)
 
-    async def _analyze_with_claude(self, prompt: str, fallback_severity: str) -> Dict:
-        """Analyze using Claude"""
+    async def _complete_with_claude(self, prompt: str, schema_name: str, max_tokens: int, escalate: bool = False) -> Dict:
+        """Complete using Claude, forcing a tool call whose input is the result"""
         client = self.providers['claude']['client']
-        response = client.messages.create(
-            model="claude-3-sonnet-20240229",
-            max_tokens=300,
+        response = await client.messages.create(
+            model=AI_MODELS['claude'][1 if escalate else 0],
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}],
+            tools=CLAUDE_TOOLS,
+            tool_choice={"type": "tool", "name": schema_name},
             messages=[{"role": "user", "content": prompt}]
         )
-        result = self._parse_ai_response(response.content[0].text, fallback_severity)
-        result['provider_used'] = 'claude'
-        return result
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+        raise ValueError("Claude reply contained no tool call")
 
-    def _parse_ai_response(self, response_text: str, fallback_severity: str) -> Dict:
+    def _parse_ai_response(self, result: Dict, fallback_severity: str) -> Dict:
         """Parse AI response into standardized format"""
         try:
-            # Clean response text
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3]
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3]
-
-            result = json.loads(response_text.strip())
-
-            # Validate response
-            if "severity" not in result or result["severity"] not in ["Critical", "High", "Medium", "Low"]:
-                raise ValueError("Invalid severity in response")
+            return self._normalize_result(result, fallback_severity)
+        except Exception as e:
+            raise ValueError(f"Failed to parse AI response: {e}")
 
-            return {
-                "severity": result["severity"],
-                "ai_corrected": result["severity"] != fallback_severity,
-                "correction_reason": result.get("reason", "AI analysis completed"),
-                "confidence": result.get("confidence", "medium")
-            }
+    def _parse_batch_response(self, reply: Dict, items: List[tuple]) -> List:
+        """Parse a batched reply, routing each entry back to its finding by id"""
+        try:
+            by_id = {str(entry.get("id")): entry for entry in reply["results"] if isinstance(entry, dict)}
         except Exception as e:
             raise ValueError(f"Failed to parse AI response: {e}")
 
+        results = []
+        for index, (_, _, fallback_severity) in enumerate(items):
+            try:
+                results.append(self._normalize_result(by_id[str(index)], fallback_severity))
+            except KeyError:
+                results.append(ValueError(f"Failed to parse AI response: no result for finding {index}"))
+            except Exception as e:
+                results.append(ValueError(f"Failed to parse AI response: {e}"))
+        return results
+
+    @staticmethod
+    def _normalize_result(result: Dict, fallback_severity: str) -> Dict:
+        # Validate response
+        if "severity" not in result or result["severity"] not in ["Critical", "High", "Medium", "Low"]:
+            raise ValueError("Invalid severity in response")
+
+        return {
+            "severity": result["severity"],
+            "ai_corrected": result["severity"] != fallback_severity,
+            "correction_reason": result.get("reason", "AI analysis completed"),
+            "confidence": result.get("confidence", "medium")
+        }
+
 # Initialize AI provider manager
 ai_manager = AIProviderManager()
 
-# --- Enhanced Severity Analysis ---
-async def correct_severity_with_ai(criterion: str, original_remarks: str, fallback_severity: str, provider: Optional[str] = None) -> Dict:
-    """Use AI to review and correct severity based on remarks"""
-    return await ai_manager.analyze_severity(criterion, original_remarks, fallback_severity, provider)
-
-def _assign_severity_fallback(remarks: str) -> str:
-    """Enhanced keyword-based severity analysis as fallback"""
-    if not remarks:
-        return "Low"
-
-    remarks_lower = remarks.lower()
-
-    critical_patterns = [
-        r'keyboard trap', r'not accessible.*keyboard', r'blocks.*screen reader',
-        r'content disappears', r'no keyboard access', r'completely inaccessible',
-        r'cannot.*navigate', r'prevents.*completion'
-    ]
-
-    high_patterns = [
-        r'poor contrast', r'difficult.*use', r'confusing navigation',
-        r'illogical order', r'session timeout', r'missing.*alt.*text',
-        r'color.*only.*indicator', r'auto.*refresh', r'significant.*barrier'
-    ]
-
-    medium_patterns = [
-        r'inconsistent', r'unclear.*purpose', r'status.*not.*announced',
-        r'some.*images.*missing', r'minor.*navigation', r'workaround.*available',
-        r'partially.*accessible'
-    ]
-
-    for pattern in critical_patterns:
-        if re.search(pattern, remarks_lower):
-            return "Critical"
-    for pattern in high_patterns:
-        if re.search(pattern, remarks_lower):
-            return "High"
-    for pattern in medium_patterns:
-        if re.search(pattern, remarks_lower):
-            return "Medium"
-
-    return "Low"
-
-# --- Metadata Extraction (Unchanged) ---
-def _extract_metadata(text: str):
-    vpat_version_match = re.search(r'VPAT\s*®?\s*Version\s*([\d\.]+)', text, re.IGNORECASE)
-    if not vpat_version_match:
-        vpat_version_match = re.search(r'VPAT\s*®\s*Version\s*(2.5)', text, re.IGNORECASE)
-
-    product_version_match = re.search(r'(Name\sOf\sProduct:?|Name of the Product)\s*(.*)', text, re.IGNORECASE)
-    report_date_match = re.search(r'(Date:|Report\s*Date)\s*([A-Za-z]+\s+\d{1,2},\s*\d{4})', text, re.IGNORECASE)
-
-    report_age = "Not Found"
-    if report_date_match:
-        date_str = report_date_match.group(2)
-        try:
-            report_date = datetime.strptime(date_str, "%B %d, %Y") if " " in date_str else datetime.strptime(date_str, "%b %d, %Y")
-            today = datetime(2025, 9, 3)
-            months = (today.year - report_date.year) * 12 + today.month - report_date.month
-            report_age = f"{months} months old" if months < 12 else f"Over {months // 12} year(s) old"
-        except ValueError:
-            report_age = "Could not parse date"
+# --- AI Severity Cache ---
+class SeverityCache:
+    """In-process LRU of AI severity results, backed by diskcache when installed"""
 
-    return {
-        "vpat_version": vpat_version_match.group(1) if vpat_version_match else "Not Found",
-        "product_version": product_version_match.group(2).strip().split('\n')[0] if product_version_match else "Not Found",
-        "report_age": report_age,
-    }
+    def __init__(self, max_entries: int = 1024, ttl: int = 7 * 24 * 3600, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.disk = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self.disk = diskcache.Cache(directory or os.path.join(tempfile.gettempdir(), "a11y_cache"))
+            except Exception as e:
+                print(f"✗ Disk cache unavailable, using memory only: {e}")
+
+    @staticmethod
+    def make_key(criterion: str, remarks: str, fallback_severity: str, provider: Optional[str]) -> str:
+        normalized = " ".join(remarks.lower().split())
+        raw_key = f"{provider or 'auto'}\0{criterion}\0{normalized}\0{fallback_severity}"
+        return hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self.entries.move_to_end(key)
+                return value
+            del self.entries[key]
+        if self.disk is not None:
+            value, expire_time = self.disk.get(key, expire_time=True)
+            if value is not None:
+                # Keep the disk entry's remaining lifetime so memory never outlives it
+                self._remember(key, value, None if expire_time is None else expire_time - time.time())
+            return value
+        return None
 
-# --- Enhanced PDF Parser with Multi-AI Support ---
-async def parse_pdf_report(file_bytes: bytes, ai_provider: Optional[str] = None):
-    detailed_findings = []
-    summary = {"supports": 0, "partially_supports": 0, "does_not_support": 0, "not_applicable": 0}
-    full_text = ""
-    pending_criterion = None
+    def set(self, key: str, value: Dict) -> None:
+        self._remember(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value, expire=self.ttl)
 
-    with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-        for page in pdf.pages:
-            full_text += page.extract_text(layout=True) + "\n"
-            tables = page.extract_tables()
-            for table in tables:
-                for row in table:
-                    cleaned_row = [str(cell).strip() if cell is not None else "" for cell in row]
-                    is_criterion_line = cleaned_row and re.match(r'^\d+\.\d+', cleaned_row[0])
-
-                    if len(cleaned_row) >= 3 and cleaned_row[1] != "":
-                        criterion, level, remarks = cleaned_row[0], cleaned_row[1], " ".join(cleaned_row[2:])
-                        pending_criterion = None
-                    elif is_criterion_line and cleaned_row[1] == "":
-                        pending_criterion = cleaned_row[0]
-                        continue
-                    elif pending_criterion and cleaned_row[1] != "":
-                        criterion, level, remarks = pending_criterion, cleaned_row[1], " ".join(cleaned_row[2:])
-                        pending_criterion = None
-                    else:
-                        continue
-
-                    level_lower = level.lower().replace('\n', ' ')
-                    clean_remarks = remarks.replace('\n',' ').strip()
+    def _remember(self, key: str, value: Dict, ttl: Optional[float] = None) -> None:
+        self.entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+severity_cache = SeverityCache(
+    ttl=int(os.getenv("AI_CACHE_TTL", str(7 * 24 * 3600))),
+    directory=os.getenv("AI_CACHE_DIR")
+)
 
-                    if "partially supports" in level_lower or "does not support" in level_lower:
-                        fallback_severity = _assign_severity_fallback(clean_remarks)
-                        ai_result = await correct_severity_with_ai(criterion, clean_remarks, fallback_severity, ai_provider)
+# Remarks this short are too generic for a cached review to be trusted
+CACHE_MIN_REMARKS = 20
 
-                        finding = {
-                            "criterion": criterion.replace('\n',' '),
-                            "level": "Partially Supports" if "partially supports" in level_lower else "Does Not Support",
-                            "remarks": clean_remarks,
-                            "severity": ai_result["severity"],
-                            "original_severity": fallback_severity,
-                            "ai_corrected": ai_result["ai_corrected"],
-                            "correction_reason": ai_result["correction_reason"],
-                            "confidence": ai_result["confidence"],
-                            "provider_used": ai_result["provider_used"]
-                        }
+# --- Enhanced Severity Analysis ---
+async def correct_severity_with_ai(criterion: str, original_remarks: str, fallback_severity: str, provider: Optional[str] = None) -> Dict:
+    """Use AI to review and correct severity based on remarks, reusing cached reviews"""
+    cacheable = len(original_remarks.strip()) >= CACHE_MIN_REMARKS
+    key = SeverityCache.make_key(criterion, original_remarks, fallback_severity, provider)
 
-                        detailed_findings.append(finding)
+    cached = severity_cache.get(key) if cacheable else None
+    if cached is not None:
+        return {
+            "severity": cached["severity"],
+            "ai_corrected": cached["severity"] != fallback_severity,
+            "correction_reason": cached["reason"],
+            "confidence": cached["confidence"],
+            "provider_used": "cache"
+        }
+
+    result = await ai_manager.analyze_severity(criterion, original_remarks, fallback_severity, provider)
+
+    # Only genuine AI reviews are cached; fallbacks should be retried next time
+    if cacheable and result["provider_used"] != "none":
+        severity_cache.set(key, {
+            "severity": result["severity"],
+            "reason": result["correction_reason"],
+            "confidence": result["confidence"]
+        })
+    return result
+
+# --- Findings ---
+@dataclass
+class Finding:
+    """One Partially Supports / Does Not Support row; orjson serializes it directly"""
+    # Declared by hand rather than dataclass(slots=True) to keep Python 3.8 support
+    __slots__ = ("criterion", "level", "remarks", "severity", "original_severity",
+                 "ai_corrected", "correction_reason", "confidence", "provider_used")
+
+    criterion: str
+    level: str
+    remarks: str
+    severity: str
+    original_severity: str
+    ai_corrected: bool
+    correction_reason: str
+    confidence: str
+    provider_used: str
+
+    def apply_review(self, ai_result: Dict) -> None:
+        """Take the severity and review details from an AI result"""
+        self.severity = ai_result["severity"]
+        self.ai_corrected = ai_result["ai_corrected"]
+        self.correction_reason = ai_result["correction_reason"]
+        self.confidence = ai_result["confidence"]
+        self.provider_used = ai_result["provider_used"]
+
+async def _apply_ai_corrections(findings: List[Finding], provider: Optional[str] = None) -> None:
+    """Review unique findings with AI concurrently, bounded by AI_MAX_CONCURRENCY"""
+    semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+    # Identical rows share one review; results are scattered back afterwards
+    groups: Dict[tuple, List[Finding]] = {}
+    for finding in findings:
+        key = (finding.criterion, finding.remarks, finding.original_severity)
+        groups.setdefault(key, []).append(finding)
+
+    async def review(key: tuple) -> Dict:
+        async with semaphore:
+            return await correct_severity_with_ai(*key, provider)
+
+    results = await asyncio.gather(*(review(key) for key in groups), return_exceptions=True)
+
+    for (key, group), ai_result in zip(groups.items(), results):
+        if isinstance(ai_result, Exception):
+            ai_result = {
+                "severity": key[2],
+                "ai_corrected": False,
+                "correction_reason": f"AI analysis failed: {str(ai_result)[:100]}",
+                "confidence": "fallback",
+                "provider_used": "none"
+            }
+        for finding in group:
+            finding.apply_review(ai_result)
+
+# --- Parallel PDF Page Extraction ---
+# PDF extraction runs in worker processes; PDF_WORKERS=0 keeps it in-process
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", os.cpu_count() or 1))
+PDF_MIN_PAGES_PER_WORKER = 5
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# Workers come from a fork server (or are spawned), never forked from this
+# threaded process; they import only app.pdf_extraction
+PDF_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
-                        if "partially supports" in level_lower:
-                            summary["partially_supports"] += 1
-                        else:
-                            summary["does_not_support"] += 1
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the page extraction worker pool, creating it if needed"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=PDF_MP_CONTEXT)
+    return _pdf_pool
+
+def _page_chunks(page_count: int) -> List[tuple]:
+    """Split pages into contiguous (start, stop) ranges, one per worker"""
+    workers = max(1, min(PDF_WORKERS, page_count // PDF_MIN_PAGES_PER_WORKER))
+    size = -(-page_count // workers) if page_count else 0
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size or 1)]
+
+@contextmanager
+def _pdf_path_for_workers(stream: BinaryIO):
+    """Yield a file path worker processes can open, spilling the upload to disk if needed"""
+    name = getattr(stream, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        yield name
+        return
+    position = stream.tell()
+    stream.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as spill:
+        shutil.copyfileobj(stream, spill)
+    stream.seek(position)
+    try:
+        yield spill.name
+    finally:
+        os.unlink(spill.name)
+
+CRITERION_LINE_RE = re.compile(r'^\d+\.\d+')
+
+# Summary buckets that produce a detailed finding, with their display label
+FINDING_LEVELS = {"partially_supports": "Partially Supports", "does_not_support": "Does Not Support"}
+
+# Phrases searched anywhere in the cell, in priority order: "partially
+# supports" and "does not support" must win over their "supports" substring,
+# including in multi-platform cells such as "Supports\nPartially Supports"
+LEVEL_MAP = (
+    ("partially supports", "partially_supports"),
+    ("does not support", "does_not_support"),
+    ("supports", "supports"),
+    ("not applicable", "not_applicable"),
+)
 
-                    elif "supports" in level_lower:
-                        summary["supports"] += 1
-                    elif "not applicable" in level_lower:
-                        summary["not_applicable"] += 1
+# Cell line breaks and tabs become spaces so multi-line levels still match
+_NL_TRANS = str.maketrans("\n\r\t", "   ")
 
-    metadata = _extract_metadata(full_text)
+def _classify_level(level: str) -> Optional[str]:
+    """Map a conformance level cell to its summary bucket"""
+    level_lower = level.lower().translate(_NL_TRANS)
+    for phrase, bucket in LEVEL_MAP:
+        if phrase in level_lower:
+            return bucket
+    return None
 
-    ai_corrections = sum(1 for f in detailed_findings if f["ai_corrected"])
-    providers_used = list(set(f["provider_used"] for f in detailed_findings if f["provider_used"] != "none"))
+# --- Enhanced PDF Parser with Multi-AI Support ---
+
+def _parse_pdf_sync(stream: BinaryIO) -> tuple:
+    """Extract findings, the subset needing AI review, summary counts and metadata from a PDF (blocking)"""
+    detailed_findings = []
+    summary = {"supports": 0, "partially_supports": 0, "does_not_support": 0, "not_applicable": 0}
+    pending_review = []
+    pending_criterion = None
+
+    with pdfplumber.open(stream) as pdf:
+        chunks = _page_chunks(len(pdf.pages))
+        # Documents too small to split are cheaper to extract here than to hand off
+        use_workers = PDF_WORKERS > 0 and len(chunks) > 1
+        if not use_workers:
+            metadata = pdf_metadata(pdf)
+            page_tables = [tables_on_page(page) for page in pdf.pages]
+
+    if use_workers:
+        # CPU-heavy text and table extraction happens outside this process's GIL
+        pool = _get_pdf_pool()
+        with _pdf_path_for_workers(stream) as path:
+            metadata_job = pool.submit(extract_pdf_metadata, path)
+            table_jobs = [pool.submit(extract_page_tables, path, start, stop) for start, stop in chunks]
+            metadata = metadata_job.result()
+            page_tables = [tables for job in table_jobs for tables in job.result()]
+
+    for tables in page_tables:
+        for table in tables:
+            for row in table:
+                cleaned_row = [str(cell).strip() if cell is not None else "" for cell in row]
+
+                if len(cleaned_row) >= 3 and cleaned_row[1] != "":
+                    criterion, level, remarks = cleaned_row[0], cleaned_row[1], " ".join(cleaned_row[2:])
+                    pending_criterion = None
+                elif cleaned_row and CRITERION_LINE_RE.match(cleaned_row[0]) and cleaned_row[1] == "":
+                    pending_criterion = cleaned_row[0]
+                    continue
+                elif pending_criterion and cleaned_row[1] != "":
+                    criterion, level, remarks = pending_criterion, cleaned_row[1], " ".join(cleaned_row[2:])
+                    pending_criterion = None
+                else:
+                    continue
+
+                level_bucket = _classify_level(level)
+                if level_bucket is None:
+                    continue
+                summary[level_bucket] += 1
+
+                if level_bucket in FINDING_LEVELS:
+                    clean_remarks = remarks.replace('\n',' ').strip()
+                    fallback_severity, match_score = assign_severity_fallback(clean_remarks)
+                    needs_review = AI_REVIEW_ALL or needs_ai_review(clean_remarks, fallback_severity, match_score)
+
+                    # AI fields are filled in by one concurrent pass after parsing
+                    finding = Finding(
+                        criterion=criterion.replace('\n',' '),
+                        level=FINDING_LEVELS[level_bucket],
+                        remarks=clean_remarks,
+                        severity=fallback_severity,
+                        original_severity=fallback_severity,
+                        ai_corrected=False,
+                        correction_reason="" if needs_review else "Keyword analysis was conclusive; AI review skipped",
+                        confidence="fallback" if needs_review else "high",
+                        provider_used="none" if needs_review else "rules"
+                    )
+
+                    detailed_findings.append(finding)
+                    if needs_review:
+                        pending_review.append(finding)
+
+    if metadata is None:
+        metadata = extract_metadata("")
+
+    return detailed_findings, pending_review, summary, metadata
+
+async def parse_pdf_report(stream: BinaryIO, ai_provider: Optional[str] = None):
+    # Parsing is CPU-bound; keep it off the event loop so other requests proceed
+    detailed_findings, pending_review, summary, metadata = await asyncio.get_running_loop().run_in_executor(
+        None, _parse_pdf_sync, stream
+    )
+
+    # "fallback" asks for keyword-based severities only
+    if ai_provider != AIProvider.FALLBACK.value:
+        await _apply_ai_corrections(pending_review, ai_provider)
+
+    ai_corrections = sum(1 for f in detailed_findings if f.ai_corrected)
+    providers_used = list(set(f.provider_used for f in detailed_findings if f.provider_used not in ("none", "rules")))
 
     metadata["ai_analysis_summary"] = {
         "total_analyzed": len(detailed_findings),
@@ -388,18 +818,61 @@ async def parse_pdf_report(file_bytes: bytes, ai_provider: Optional[str] = None)
     return {**metadata, "summary": summary, "detailed_findings": detailed_findings}
 
 # --- Placeholder Parsers ---
-async def parse_docx_report(file_bytes: bytes, ai_provider: Optional[str] = None):
-    doc = docx.Document(BytesIO(file_bytes))
+def _parse_docx_sync(stream: BinaryIO) -> Dict:
+    doc = docx.Document(stream)
     full_text = "\n".join([p.text for p in doc.paragraphs])
-    metadata = _extract_metadata(full_text)
+    return extract_metadata(full_text)
+
+# Elements that carry VPAT header fields. Only the first two cells of a row
+# are read, which skips the long remarks column that makes up most reports.
+HTML_METADATA_SELECTOR = "title, h1, h2, h3, h4, p, li, th, td:nth-child(-n+2)"
+
+def _parse_html_sync(stream: BinaryIO) -> Dict:
+    tree = LexborHTMLParser(stream.read())
+    header_text = "\n".join(node.text(separator='') for node in tree.css(HTML_METADATA_SELECTOR))
+    metadata = extract_metadata(header_text)
+
+    # Layouts that keep header fields in other elements still get a full-text pass
+    if not metadata_complete(metadata) and tree.root is not None:
+        metadata = merge_metadata(metadata, extract_metadata(tree.root.text(separator='')))
+    return metadata
+
+async def parse_docx_report(stream: BinaryIO, ai_provider: Optional[str] = None):
+    metadata = await asyncio.get_running_loop().run_in_executor(None, _parse_docx_sync, stream)
     return {**metadata, "summary": {}, "detailed_findings": []}
 
-async def parse_html_report(content: bytes, ai_provider: Optional[str] = None):
-    soup = BeautifulSoup(content, 'lxml')
-    metadata = _extract_metadata(soup.get_text())
+async def parse_html_report(stream: BinaryIO, ai_provider: Optional[str] = None):
+    metadata = await asyncio.get_running_loop().run_in_executor(None, _parse_html_sync, stream)
     return {**metadata, "summary": {}, "detailed_findings": []}
 
 # --- API Endpoints ---
+# Leading bytes read to check an upload's format before parsing it
+UPLOAD_SIGNATURE_SIZE = 1024
+
+def _matches_file_signature(file_extension: str, head: bytes) -> bool:
+    """Check the upload's leading bytes against the format its extension claims"""
+    if file_extension == ".pdf":
+        # The PDF header may be preceded by junk within the first 1024 bytes
+        return b"%PDF-" in head
+    if file_extension == ".docx":
+        return head.startswith(b"PK\x03\x04")
+    if file_extension == ".html":
+        return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<")
+    return False
+
+@app.on_event("startup")
+async def start_executors():
+    # Start every PDF worker now, so the first large upload doesn't wait on process startup
+    if PDF_WORKERS > 0:
+        pool = _get_pdf_pool()
+        await asyncio.gather(*(asyncio.wrap_future(pool.submit(worker_ready)) for _ in range(PDF_WORKERS)))
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    await ai_manager.aclose()
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False)
+
 @app.get("/", tags=["General"])
 async def read_root():
     available_providers = ai_manager.get_available_providers()
@@ -423,6 +896,7 @@ async def get_ai_providers():
         "provider_details": {
             name: {
                 "configured": config.get('configured', False),
+                "model": AI_MODELS[name][0],
                 "library_available": AI_PROVIDERS.get(name, False),
                 "api_key_present": bool(os.getenv(f"{name.upper()}_API_KEY")) if name != 'claude' else bool(os.getenv("ANTHROPIC_API_KEY"))
             }
@@ -433,7 +907,7 @@ async def get_ai_providers():
 @app.post("/api/analyze", tags=["Analysis"])
 async def analyze_report(
     file: UploadFile = File(...),
-    ai_provider: Optional[str] = None
+    ai_provider: Optional[AIProvider] = None
 ):
     """Analyze report with optional AI provider specification"""
     allowed_extensions = {".pdf", ".docx", ".html"}
@@ -441,30 +915,38 @@ async def analyze_report(
     if file_extension not in allowed_extensions:
         raise HTTPException(status_code=400, detail="Invalid file type.")
 
-    # Validate AI provider if specified
-    if ai_provider and ai_provider not in ai_manager.get_available_providers():
-        available = ai_manager.get_available_providers()
+    # Unknown names are rejected by the AIProvider enum; check the provider is configured
+    provider = ai_provider.value if ai_provider else None
+    if provider and provider != AIProvider.FALLBACK.value and provider not in ai_manager.get_available_providers():
         raise HTTPException(
             status_code=400,
-            detail=f"AI provider '{ai_provider}' not available. Available providers: {available}"
+            detail=f"AI provider '{provider}' not available. Available providers: {list(ai_manager.get_available_providers())}"
         )
 
-    file_contents = await file.read()
     analysis_data = {}
 
+    # Starlette has already spooled the upload (to disk once large), so the
+    # parsers read that file directly instead of a copy
+    head = await file.read(UPLOAD_SIGNATURE_SIZE)
+    if not _matches_file_signature(file_extension, head):
+        raise HTTPException(status_code=415, detail=f"File content does not match a {file_extension} document.")
+    await file.seek(0)
+
     if file_extension == ".pdf":
-        analysis_data = await parse_pdf_report(file_contents, ai_provider)
+        analysis_data = await parse_pdf_report(file.file, provider)
     elif file_extension == ".docx":
-        analysis_data = await parse_docx_report(file_contents, ai_provider)
+        analysis_data = await parse_docx_report(file.file, provider)
     elif file_extension == ".html":
-        analysis_data = await parse_html_report(file_contents, ai_provider)
+        analysis_data = await parse_html_report(file.file, provider)
 
     providers_used = analysis_data.get("ai_analysis_summary", {}).get("providers_used", [])
-    provider_text = f" using {', '.join(providers_used)}" if providers_used else ""
+    provider_names = ["cached reviews" if p == "cache" else p for p in providers_used]
+    provider_text = f" using {', '.join(provider_names)}" if providers_used else ""
 
-    return {
+    # Returned as a response so the findings skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
         "filename": file.filename,
         "content_type": file.content_type,
         "status": f"Analysis complete with AI enhancement{provider_text}." if providers_used else "Analysis complete with keyword-based severity.",
         "analysis_results": analysis_data
-    }
\ No newline at end of file
+    })
\ No newline at end of file
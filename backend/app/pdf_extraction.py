@@ -0,0 +1,118 @@
+"""
+PDF text, table and metadata extraction.
+
+Kept apart from main so PDF worker processes import only pdfplumber and
+these helpers, not the web app, AI clients and severity matchers.
+"""
+
+import os
+import re
+import importlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pdfplumber
+
+# Optional native PDF backends that mirror the pdfplumber API
+# (open / pages / extract_text / extract_tables). Opt in via PDF_BACKEND.
+PDF_BACKEND_MODULES = {
+    "ripdoc": "ripdoc",
+    "pdfplumber-rs": "pdfplumber_rs",
+    "pdfplumber_rs": "pdfplumber_rs",
+}
+
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pdfplumber").strip().lower()
+if PDF_BACKEND in PDF_BACKEND_MODULES:
+    try:
+        pdfplumber = importlib.import_module(PDF_BACKEND_MODULES[PDF_BACKEND])
+    except ImportError as e:
+        print(f"✗ PDF backend '{PDF_BACKEND}' unavailable, using pdfplumber: {e}")
+        PDF_BACKEND = "pdfplumber"
+elif PDF_BACKEND != "pdfplumber":
+    print(f"✗ Unknown PDF backend '{PDF_BACKEND}', using pdfplumber")
+    PDF_BACKEND = "pdfplumber"
+
+# --- Metadata Extraction ---
+VPAT_RE = re.compile(r'VPAT\s*®?\s*Version\s*([\d\.]+)', re.IGNORECASE)
+PRODUCT_RE = re.compile(r'(Name\sOf\sProduct:?|Name of the Product)\s*(.*)', re.IGNORECASE)
+DATE_RE = re.compile(r'(Date:|Report\s*Date)\s*(?P<month>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})', re.IGNORECASE)
+
+# Full and abbreviated English month names, so dates need no strptime parsing
+MONTH_NAMES = ["january", "february", "march", "april", "may", "june", "july",
+               "august", "september", "october", "november", "december"]
+MONTHS = {name: number for number, name in enumerate(MONTH_NAMES, start=1)}
+MONTHS.update({name[:3]: number for name, number in list(MONTHS.items())})
+MONTHS["sept"] = 9
+
+def extract_metadata(text: str):
+    vpat_version_match = VPAT_RE.search(text)
+    product_version_match = PRODUCT_RE.search(text)
+    report_date_match = DATE_RE.search(text)
+
+    report_age = "Not Found"
+    if report_date_match:
+        try:
+            report_date = datetime(
+                int(report_date_match.group("year")),
+                MONTHS[report_date_match.group("month").lower()],
+                int(report_date_match.group("day"))
+            )
+            today = datetime.now(timezone.utc)
+            months = (today.year - report_date.year) * 12 + today.month - report_date.month
+            report_age = f"{months} months old" if months < 12 else f"Over {months // 12} year(s) old"
+        except (KeyError, ValueError):
+            report_age = "Could not parse date"
+
+    return {
+        "vpat_version": vpat_version_match.group(1) if vpat_version_match else "Not Found",
+        "product_version": product_version_match.group(2).strip() if product_version_match else "Not Found",
+        "report_age": report_age,
+    }
+
+# VPAT headers live on the opening pages; later pages are never scanned for them
+METADATA_MAX_PAGES = 3
+
+def merge_metadata(metadata: Optional[Dict], page_metadata: Dict) -> Dict:
+    """Fill fields still missing from earlier pages with this page's values"""
+    if metadata is None:
+        return page_metadata
+    return {key: value if value != "Not Found" else page_metadata[key] for key, value in metadata.items()}
+
+def metadata_complete(metadata: Optional[Dict]) -> bool:
+    """True once every metadata field has been located"""
+    return metadata is not None and all(value != "Not Found" for value in metadata.values())
+
+def pdf_metadata(pdf) -> Optional[Dict]:
+    """Merge metadata from the opening pages, stopping once every field is found"""
+    metadata = None
+    for page in pdf.pages[:METADATA_MAX_PAGES]:
+        if metadata_complete(metadata):
+            break
+        metadata = merge_metadata(metadata, extract_metadata(page.extract_text(layout=True) or ""))
+    return metadata
+
+# --- Table Extraction ---
+# Criterion numbers such as 1.4.3 or 302.1; pages without one hold no findings
+CRITERION_NUM_RE = re.compile(r'\b\d+\.\d+(?:\.\d+)?\b')
+
+def tables_on_page(page) -> List:
+    """Extract a page's tables, skipping pages with no criterion numbers"""
+    if not CRITERION_NUM_RE.search(page.extract_text() or ""):
+        return []
+    return page.extract_tables()
+
+# --- Worker Process Entry Points ---
+# Workers open the PDF by path, so no document bytes are pickled per job
+def extract_page_tables(path: str, start: int, stop: int) -> List[List]:
+    """Extract tables for pages [start, stop) in a worker process"""
+    with pdfplumber.open(path) as pdf:
+        return [tables_on_page(page) for page in pdf.pages[start:stop]]
+
+def extract_pdf_metadata(path: str) -> Optional[Dict]:
+    """Extract report metadata in a worker process"""
+    with pdfplumber.open(path) as pdf:
+        return pdf_metadata(pdf)
+
+def worker_ready() -> bool:
+    """No-op job used to start workers and import this module ahead of uploads"""
+    return True
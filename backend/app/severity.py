@@ -0,0 +1,214 @@
+"""Keyword-based severity classification shared by the report parsers."""
+import re
+import threading
+from typing import Dict
+
+# --- Optional Accelerators ---
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Severity keyword patterns, fused at import time into a single pattern with
+# one named group per keyword so each finding's remarks are scanned only once.
+CRITICAL_PATTERNS = [
+    r'keyboard trap', r'not accessible.*keyboard', r'blocks.*screen reader',
+    r'content disappears', r'no keyboard access', r'completely inaccessible',
+    r'cannot.*navigate', r'prevents.*completion'
+]
+
+HIGH_PATTERNS = [
+    r'poor contrast', r'difficult.*use', r'confusing navigation',
+    r'illogical order', r'session timeout', r'missing.*alt.*text',
+    r'color.*only.*indicator', r'auto.*refresh', r'significant.*barrier'
+]
+
+MEDIUM_PATTERNS = [
+    r'inconsistent', r'unclear.*purpose', r'status.*not.*announced',
+    r'some.*images.*missing', r'minor.*navigation', r'workaround.*available',
+    r'partially.*accessible'
+]
+
+TIER_PATTERNS = (("critical", CRITICAL_PATTERNS), ("high", HIGH_PATTERNS), ("medium", MEDIUM_PATTERNS))
+
+def _fused_tier_regex(tier_patterns) -> "re.Pattern":
+    """Fuse tiers into one pattern with a named group per keyword.
+
+    Groups are named '<tier>_<index>' so a match identifies both its tier and
+    the keyword that fired. The union is wrapped in a lookahead so matches are
+    zero-width: a greedy lower-tier pattern such as 'difficult.*use' cannot
+    consume a critical keyword that appears later in the same remarks.
+    """
+    groups = "|".join(
+        f"(?P<{tier}_{index}>{pattern})"
+        for tier, patterns in tier_patterns
+        for index, pattern in enumerate(patterns)
+    )
+    return re.compile(f"(?={groups})", re.IGNORECASE)
+
+SEVERITY_RE = _fused_tier_regex(TIER_PATTERNS)
+
+SEVERITY_RANK = {"critical": 3, "high": 2, "medium": 1}
+SEVERITY_LABELS = {"critical": "Critical", "high": "High", "medium": "Medium"}
+
+def _build_severity_database():
+    """Compile all severity patterns into one Hyperscan database, if available"""
+    if not HYPERSCAN_AVAILABLE:
+        return None, []
+
+    tiers = []
+    expressions = []
+    for tier, patterns in TIER_PATTERNS:
+        for pattern in patterns:
+            tiers.append(tier)
+            expressions.append(pattern.encode())
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+        )
+        print("✓ Hyperscan severity matcher compiled")
+        return database, tiers
+    except Exception as e:
+        print(f"✗ Hyperscan compilation failed, using regex matcher: {e}")
+        return None, []
+
+SEVERITY_HS_DB, SEVERITY_HS_TIERS = _build_severity_database()
+
+# Hyperscan scratch space is single-user and scans release the GIL, so every
+# thread classifying remarks (parsers run on the default executor) needs its own
+_hs_thread_state = threading.local()
+
+def _hyperscan_scratch() -> "hyperscan.Scratch":
+    """Return this thread's scratch space for SEVERITY_HS_DB, allocating it on first use"""
+    scratch = getattr(_hs_thread_state, "scratch", None)
+    if scratch is None:
+        scratch = _hs_thread_state.scratch = hyperscan.Scratch(SEVERITY_HS_DB)
+    return scratch
+
+# Keywords are either plain phrases or phrases chained with '.*', e.g.
+# 'missing.*alt.*text'; both fit the automaton as ordered anchor sequences
+CHAINED_PATTERN_RE = re.compile(r'^[\w ]+(?:\.\*[\w ]+)*$')
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over every severity keyword anchor.
+
+    Each pattern is split on '.*' into anchors; the automaton payload for an
+    anchor lists (tier, pattern key, anchor position, anchor count) for every
+    pattern using it. Returns None if any pattern needs real regex syntax.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    anchors = {}
+    for tier, patterns in TIER_PATTERNS:
+        for index, pattern in enumerate(patterns):
+            if not CHAINED_PATTERN_RE.match(pattern):
+                return None
+            parts = pattern.split(".*")
+            for position, anchor in enumerate(parts):
+                anchors.setdefault(anchor, []).append((tier, f"{tier}_{index}", position, len(parts)))
+
+    automaton = ahocorasick.Automaton()
+    for anchor, uses in anchors.items():
+        automaton.add_word(anchor, (len(anchor), tuple(uses)))
+    automaton.make_automaton()
+    return automaton
+
+SEVERITY_AUTOMATON = _build_keyword_automaton()
+
+# Distinct keyword hits needed before the keyword tier is trusted without AI review
+CONFIDENT_MATCH_SCORE = 2
+
+def _best_tier(hits: Dict[str, set]) -> tuple:
+    """Pick the most severe tier hit and how many distinct keywords back it"""
+    tier = max(hits, key=SEVERITY_RANK.get, default=None)
+    return tier, len(hits[tier]) if tier else 0
+
+def _match_tier_hyperscan(remarks: str) -> tuple:
+    """Return (tier, score) for the most severe tier, scanning all patterns in one pass"""
+    hits = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        tier = SEVERITY_HS_TIERS[pattern_id]
+        hits.setdefault(tier, set()).add(pattern_id)
+        # Returning True terminates the scan; nothing outranks a confident critical
+        return tier == "critical" and len(hits[tier]) >= CONFIDENT_MATCH_SCORE
+
+    try:
+        SEVERITY_HS_DB.scan(remarks.encode("utf-8"), match_event_handler=on_match, scratch=_hyperscan_scratch())
+    except hyperscan.ScanTerminated:
+        pass
+
+    return _best_tier(hits)
+
+def _match_tier_automaton(remarks: str) -> tuple:
+    """Return (tier, score) from one automaton pass per line of remarks.
+
+    A chained pattern matches once its anchors occur in order without
+    overlapping. Like '.' in the regex patterns, chains never span lines.
+    """
+    hits = {}
+    for line in remarks.lower().split("\n"):
+        # pattern key -> (anchors matched so far, end index of the last one)
+        progress = {}
+        for end, (length, uses) in SEVERITY_AUTOMATON.iter(line):
+            start = end - length + 1
+            for tier, key, position, count in uses:
+                matched, last_end = progress.get(key, (0, -1))
+                if matched != position or start <= last_end:
+                    continue
+                progress[key] = (matched + 1, end)
+                if matched + 1 < count:
+                    continue
+                hits.setdefault(tier, set()).add(key)
+                if tier == "critical" and len(hits[tier]) >= CONFIDENT_MATCH_SCORE:
+                    return _best_tier(hits)
+    return _best_tier(hits)
+
+def _match_tier_regex(remarks: str) -> tuple:
+    """Return (tier, score) for the most severe tier using the fused regex"""
+    hits = {}
+    for match in SEVERITY_RE.finditer(remarks):
+        tier = match.lastgroup.partition("_")[0]
+        hits.setdefault(tier, set()).add(match.lastgroup)
+        if tier == "critical" and len(hits[tier]) >= CONFIDENT_MATCH_SCORE:
+            break
+    return _best_tier(hits)
+
+def assign_severity_fallback(remarks: str) -> tuple:
+    """Enhanced keyword-based severity analysis as fallback.
+
+    Returns (severity, score) where score counts the distinct keywords that
+    matched the chosen tier.
+    """
+    if not remarks:
+        return "Low", 0
+
+    if SEVERITY_HS_DB is not None:
+        tier, score = _match_tier_hyperscan(remarks)
+    elif SEVERITY_AUTOMATON is not None:
+        tier, score = _match_tier_automaton(remarks)
+    else:
+        tier, score = _match_tier_regex(remarks)
+
+    return SEVERITY_LABELS.get(tier, "Low"), score
+
+AI_REVIEW_MIN_REMARKS = 20
+
+def needs_ai_review(remarks: str, severity: str, score: int) -> bool:
+    """Skip AI for terse remarks, Critical keyword matches and tiers backed by several keywords"""
+    if len(remarks) < AI_REVIEW_MIN_REMARKS or severity == "Critical":
+        return False
+    return score < CONFIDENT_MATCH_SCORE
@@ -0,0 +1,31 @@
+"""Regression checks for keyword severity classification.
+
+Run from backend/ with: python -m unittest discover tests
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from app.severity import assign_severity_fallback
+
+REMARKS = [
+    "Keyboard trap in the date picker; focus cannot navigate out of the dialog",
+    "Poor contrast on links and missing alt text on icon buttons",
+    "Inconsistent labels across forms, a workaround available via tooltips",
+]
+
+
+class ConcurrentSeverityTest(unittest.TestCase):
+    def test_threads_share_matcher_safely(self):
+        """Parsers classify remarks from executor threads; results must not depend on concurrency"""
+        expected = [assign_severity_fallback(remarks) for remarks in REMARKS]
+
+        def classify(worker: int) -> list:
+            return [assign_severity_fallback(REMARKS[n % len(REMARKS)]) for n in range(5000)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for results in pool.map(classify, range(8)):
+                self.assertEqual(results, [expected[n % len(REMARKS)] for n in range(5000)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,7 +69,7 @@ function App() {
   const getProviderDisplayName = (provider) => {
     const names = {
       'gemini': 'Google Gemini',
-      'openai': 'OpenAI GPT-4',
+      'openai': 'OpenAI',
       'claude': 'Anthropic Claude'
     };
     return names[provider] || provider;
@@ -24,8 +24,10 @@ const SeverityBadge = ({ severity, isOriginal = false }) => {
 const AIProviderBadge = ({ provider, corrected = false }) => {
   const providerInfo = {
     'gemini': { name: 'Gemini', icon: '🤖', color: 'bg-blue-100 text-blue-800 border-blue-300' },
-    'openai': { name: 'GPT-4', icon: '🔥', color: 'bg-green-100 text-green-800 border-green-300' },
+    'openai': { name: 'OpenAI', icon: '🔥', color: 'bg-green-100 text-green-800 border-green-300' },
     'claude': { name: 'Claude', icon: '🧠', color: 'bg-purple-100 text-purple-800 border-purple-300' },
+    'cache': { name: 'Cached', icon: '💾', color: 'bg-yellow-100 text-yellow-800 border-yellow-300' },
+    'rules': { name: 'Rules', icon: '📏', color: 'bg-gray-100 text-gray-800 border-gray-300' },
     'none': { name: 'Keyword', icon: '🔤', color: 'bg-gray-100 text-gray-800 border-gray-300' }
   };
 
@@ -147,7 +149,7 @@ const FindingRow = ({ item, index, onToggleExpanded, isExpanded }) => {
               </div>
 
               {/* Provider Information */}
-              {item.provider_used && item.provider_used !== 'none' && (
+              {item.provider_used && item.provider_used !== 'none' && item.provider_used !== 'rules' && (
                 <div className="bg-white p-3 rounded border-l-4 border-purple-400">
                   <h5 className="text-xs font-medium text-gray-700 uppercase tracking-wide mb-1">
                     AI Provider Used
@@ -155,9 +157,10 @@ const FindingRow = ({ item, index, onToggleExpanded, isExpanded }) => {
                   <div className="flex items-center space-x-2">
                     <AIProviderBadge provider={item.provider_used} />
                     <span className="text-sm text-gray-600">
-                      {item.provider_used === 'gemini' && 'Google Gemini 1.5 Flash'}
-                      {item.provider_used === 'openai' && 'OpenAI GPT-4'}
-                      {item.provider_used === 'claude' && 'Anthropic Claude 3 Sonnet'}
+                      {item.provider_used === 'gemini' && 'Google Gemini'}
+                      {item.provider_used === 'openai' && 'OpenAI'}
+                      {item.provider_used === 'claude' && 'Anthropic Claude'}
+                      {item.provider_used === 'cache' && 'Previously reviewed remarks'}
                     </span>
                   </div>
                 </div>
@@ -275,8 +278,9 @@ const ReportDisplay = forwardRef(({ result, reportName, reviewerName }, ref) =>
   const getProviderDisplayInfo = (provider) => {
     const info = {
       'gemini': { name: 'Google Gemini', icon: '🤖', color: 'bg-blue-100 text-blue-800' },
-      'openai': { name: 'OpenAI GPT-4', icon: '🔥', color: 'bg-green-100 text-green-800' },
-      'claude': { name: 'Anthropic Claude', icon: '🧠', color: 'bg-purple-100 text-purple-800' }
+      'openai': { name: 'OpenAI', icon: '🔥', color: 'bg-green-100 text-green-800' },
+      'claude': { name: 'Anthropic Claude', icon: '🧠', color: 'bg-purple-100 text-purple-800' },
+      'cache': { name: 'Cached', icon: '💾', color: 'bg-yellow-100 text-yellow-800' }
     };
     return info[provider] || { name: provider, icon: '🤖', color: 'bg-gray-100 text-gray-800' };
   };